@@ -5,12 +5,23 @@ import serial.tools.list_ports
 from PyQt5.QtWidgets import (QApplication, QMainWindow, QVBoxLayout, QHBoxLayout, 
                              QWidget, QComboBox, QPushButton, QCheckBox, QLineEdit,
                              QGroupBox, QLabel, QFileDialog, QScroller)
-from PyQt5.QtCore import QTimer, Qt, QSettings, pyqtSignal, QEvent
+from PyQt5.QtCore import QTimer, Qt, QSettings, pyqtSignal, QEvent, QThread
 from PyQt5.QtGui import QIntValidator, QFontMetrics
 import pyqtgraph as pg
 import numpy as np
 import time
-import csv
+import io
+import threading
+import queue
+from collections import deque
+
+try:
+    import numba
+except ImportError:
+    numba = None
+
+# Curve colors: 8 hues at 4 brightness levels, so the first channels get clearly distinct hues
+PALETTE_SIZE = 32
 
 class CustomComboBox(QComboBox):
     popupAboutToBeShown = pyqtSignal()
@@ -19,27 +30,307 @@ class CustomComboBox(QComboBox):
         self.popupAboutToBeShown.emit()
         super().showPopup()
 
+def _try_set_low_latency(ser):
+    """Best-effort switch of a Linux USB serial port to low-latency mode; no-op elsewhere."""
+    if not sys.platform.startswith('linux'):
+        return
+    # FTDI adapters hold data for latency_timer ms (16 by default) before handing it to the host
+    name = os.path.basename(os.path.realpath(ser.port))
+    try:
+        with open(f'/sys/bus/usb-serial/devices/{name}/latency_timer', 'w') as f:
+            f.write('1')
+    except OSError:
+        pass
+    # Sets ASYNC_LOW_LATENCY through TIOCGSERIAL/TIOCSSERIAL
+    try:
+        ser.set_low_latency_mode(True)
+    except (AttributeError, NotImplementedError, ValueError, OSError):
+        pass
+
+if numba is not None:
+    # Powers of ten that are exact in float64; one multiply or divide by them
+    # rounds the same way float() does for mantissas of up to 15 digits
+    _POW10 = np.array([10.0 ** k for k in range(23)])
+
+    @numba.njit(nogil=True, cache=True)
+    def _parse_fields(buf, out):
+        """Parse comma-separated decimals from buf into out; return the field count or -1."""
+        length = len(buf)
+        i = 0
+        n = 0
+        while True:
+            while i < length and (buf[i] == 32 or buf[i] == 9 or buf[i] == 13):
+                i += 1
+            if n == len(out):
+                return -1
+            negative = False
+            if i < length and (buf[i] == 45 or buf[i] == 43):  # '-' or '+'
+                negative = buf[i] == 45
+                i += 1
+
+            mantissa = 0
+            digits = 0
+            frac_digits = 0
+            seen_dot = False
+            while i < length:
+                c = buf[i]
+                if 48 <= c <= 57:
+                    mantissa = mantissa * 10 + (c - 48)
+                    digits += 1
+                    if seen_dot:
+                        frac_digits += 1
+                elif c == 46 and not seen_dot:  # '.'
+                    seen_dot = True
+                else:
+                    break
+                i += 1
+            if digits == 0 or digits > 15:
+                return -1
+
+            exponent = 0
+            if i < length and (buf[i] == 101 or buf[i] == 69):  # 'e' or 'E'
+                i += 1
+                exp_negative = False
+                if i < length and (buf[i] == 45 or buf[i] == 43):
+                    exp_negative = buf[i] == 45
+                    i += 1
+                exp_digits = 0
+                while i < length and 48 <= buf[i] <= 57 and exp_digits < 4:
+                    exponent = exponent * 10 + (buf[i] - 48)
+                    exp_digits += 1
+                    i += 1
+                if exp_digits == 0:
+                    return -1
+                if exp_negative:
+                    exponent = -exponent
+
+            scale = exponent - frac_digits
+            if scale < -22 or scale > 22:
+                return -1
+            value = float(mantissa)
+            if scale < 0:
+                value /= _POW10[-scale]
+            else:
+                value *= _POW10[scale]
+            out[n] = -value if negative else value
+            n += 1
+
+            while i < length and (buf[i] == 32 or buf[i] == 9 or buf[i] == 13):
+                i += 1
+            if i == length:
+                return n
+            if buf[i] != 44:  # ','
+                return -1
+            i += 1
+
+    @numba.njit(nogil=True, cache=True)
+    def _parse_chunk(buf):
+        """Parse newline-separated rows of buf; return an NaN-padded (N, C) array and each row's field count."""
+        n_rows = 1
+        width = 1
+        max_width = 1
+        for c in buf:
+            if c == 10:  # '\n'
+                n_rows += 1
+                width = 1
+            elif c == 44:
+                width += 1
+                max_width = max(max_width, width)
+
+        out = np.full((n_rows, max_width), np.nan)
+        widths = np.empty(n_rows, dtype=np.int64)
+        row = 0
+        start = 0
+        for i in range(len(buf) + 1):
+            if i == len(buf) or buf[i] == 10:
+                widths[row] = _parse_fields(buf[start:i], out[row])
+                row += 1
+                start = i + 1
+        return out, widths
+else:
+    _parse_chunk = None
+
+def _finite_only(block):
+    """Return block with inf replaced by NaN, so fmin/fmax bounds only see finite samples."""
+    return np.where(np.isfinite(block), block, np.nan)
+
+def _last_nonfinite_index(block, first_x):
+    """Return, per column, the sample index of the last NaN or inf in block, or -1 if there is none."""
+    if not len(block):
+        return np.full(block.shape[1], -1, dtype=np.int64)
+    bad_rows = ~np.isfinite(block)
+    last = first_x + len(block) - 1 - np.argmax(bad_rows[::-1], axis=0)
+    return np.where(bad_rows.any(axis=0), last, -1)
+
+def _parse_line(line):
+    """Parse one comma-separated line into a float64 array, or return None if it is not numeric."""
+    try:
+        values = np.fromstring(line.strip(), sep=',', dtype=np.float64)
+    except ValueError:
+        # Ignore non-numeric input
+        return None
+    # fromstring stops quietly at a trailing comma or, on NumPy 1.x, at a non-numeric field
+    if values.size != line.count(b',') + 1:
+        return None
+    return values
+
+class SerialReader(QThread):
+    """Reads and parses serial input off the GUI thread into a row-bounded queue of batches."""
+    rowsReady = pyqtSignal()
+    errorOccurred = pyqtSignal(str)
+
+    def __init__(self, ser, parent=None, max_rows=1 << 16):
+        super().__init__(parent)
+        self.ser = ser
+        self._stop_event = threading.Event()
+        self._rxbuf = bytearray()  # Received bytes not yet terminated by a newline
+        # If the GUI falls behind, the oldest batches are dropped in favour of newer ones
+        # and counted so the plot can leave a gap for them
+        self._batches = deque()
+        self._max_rows = max_rows
+        self._queued_rows = 0
+        self._dropped_rows = 0
+        self._lock = threading.Lock()  # Guards the batch queue and its row counters
+        self._notified = threading.Event()  # Set while a rowsReady signal is pending
+        self.csv_sink = None  # Queue that gets every batch, never dropping any; None when not logging
+
+    def run(self):
+        while not self._stop_event.is_set():
+            try:
+                # Block for at least one byte, then take whatever else is buffered
+                raw = self.ser.read(self.ser.in_waiting or 1)
+            except Exception as e:
+                if not self._stop_event.is_set():
+                    self.errorOccurred.emit(f"Error: {str(e)}")
+                break
+            rows = self.parse(raw)
+            if len(rows):
+                sink = self.csv_sink
+                if sink is not None:
+                    sink.put_nowait(rows)
+                with self._lock:
+                    self._batches.append(rows)
+                    self._queued_rows += len(rows)
+                    while self._queued_rows > self._max_rows and len(self._batches) > 1:
+                        dropped = len(self._batches.popleft())
+                        self._queued_rows -= dropped
+                        self._dropped_rows += dropped
+                if not self._notified.is_set():
+                    self._notified.set()
+                    self.rowsReady.emit()
+
+    def drain(self):
+        """Return and remove all queued batches and the count of rows dropped before them; called from the GUI thread."""
+        self._notified.clear()
+        with self._lock:
+            batches = list(self._batches)
+            dropped = self._dropped_rows
+            self._batches.clear()
+            self._queued_rows = 0
+            self._dropped_rows = 0
+        return batches, dropped
+
+    def parse(self, raw):
+        """Return the complete lines received so far as an (N, C) array or a list of rows."""
+        self._rxbuf += raw
+        cut = self._rxbuf.rfind(b'\n')
+        if cut < 0:
+            return []
+        chunk = bytes(self._rxbuf[:cut])
+        del self._rxbuf[:cut + 1]
+        if _parse_chunk is not None:
+            return self._parse_compiled(chunk)
+        lines = chunk.split(b'\n')
+
+        # Fast path: when every line has the same width, parse the whole chunk in one call
+        width = chunk.count(b',') // len(lines)
+        if all(line.count(b',') == width for line in lines):
+            try:
+                block = np.fromstring(chunk.replace(b'\n', b','), sep=',', dtype=np.float64)
+            except ValueError:
+                block = None
+            if block is not None and block.size == len(lines) * (width + 1):
+                return block.reshape(len(lines), width + 1)
+
+        rows = []
+        for line in lines:
+            values = _parse_line(line)
+            if values is not None and values.size:
+                rows.append(values)
+        return rows
+
+    def _parse_compiled(self, chunk):
+        block, widths = _parse_chunk(np.frombuffer(chunk, dtype=np.uint8))
+        if widths.min() == block.shape[1]:
+            return block
+
+        rows = []
+        for line, values, width in zip(chunk.split(b'\n'), block, widths):
+            if width < 0:
+                # Lines the compiled parser does not handle (nan, inf, long mantissas) take the slow path
+                values = _parse_line(line)
+                if values is None or not values.size:
+                    continue
+                rows.append(values)
+            else:
+                rows.append(values[:width])
+        return rows
+
+    def stop(self):
+        self._stop_event.set()
+        try:
+            self.ser.cancel_read()  # Wake up a blocking read
+        except Exception:
+            pass
+        self.wait()
+
 class SerialPlotter(QMainWindow):
+    csvError = pyqtSignal(str)  # Emitted from the CSV writer thread
+
     def __init__(self):
         super().__init__()
         self.setWindowTitle("Serial Plotter")
         self.setGeometry(100, 100, 1000, 600)
 
         self.serial = None
-        self.data = []
+        self.reader = None
         self.lines = []
         self.checkboxes = []
         self.settings = QSettings("MyCompany", "SerialPlotter")
         self.is_running = False
         self.max_points = 200
+        self.max_redraw_rate = 10  # Hz
+        self._capacity = 4096  # Points the ring can hold without reallocating; never shrinks
         self.legend = None
         self.total_data_count = 0
         self.csv_file = None
-        self.csv_writer = None
+        self._csv_q = None
+        self._csv_thread = None
+        self._csv_failed = False  # Set once a write fails; logging stops until the file is reopened
+        self.csvError.connect(self._on_csv_error, Qt.QueuedConnection)
         self.checkbox_widgets = []
+        self._line_visible = np.zeros(0, dtype=bool)  # Cached checkbox states
+        self._any_visible = False
+        self._legend_dirty = True  # Set when legend entries need rebuilding
+        self._dirty = False  # Set when the plot needs redrawing
+        self._editing = None  # (checkbox, line_edit) whose name is being edited
+        self._skip_message = None  # Dropped-rows notice currently shown in error_label
+        self._fm = QFontMetrics(self.font())  # Refreshed on FontChange
+        self._text_widths = {}  # Checkbox -> measured label width
+        # Pens are built once so discovering a channel never creates QColor/QPen objects
+        # intColor steps brightness up with the index; reverse the levels so the first
+        # 8 channels are drawn at full brightness and only later ones get dimmer
+        self._palette = [pg.mkPen(pg.intColor(i % 8 + (3 - i // 8) * 8, hues=8, values=4, maxValue=255),
+                                  width=1)
+                         for i in range(PALETTE_SIZE)]
+
+        # Rasterize curves through OpenGL; must be set before the PlotWidget is created
+        pg.setConfigOptions(useOpenGL=True, antialias=False, background='w', foreground='k')
 
         self.init_ui()
         self.load_settings()
+        self._reset_ring()
+        self.plot_widget.enableAutoRange(axis='y', enable=False)
 
         # Modify the legend creation
         self.legend = pg.LegendItem((-1, -1), offset=(70,20))
@@ -98,6 +389,15 @@ class SerialPlotter(QMainWindow):
         data_points_layout.addWidget(self.max_points_edit)
         control_layout.addLayout(data_points_layout)
 
+        # Max redraw rate, independent of how fast data arrives
+        redraw_rate_layout = QHBoxLayout()
+        redraw_rate_layout.addWidget(QLabel("Max redraw rate (Hz):"))
+        self.redraw_rate_edit = QLineEdit(str(self.max_redraw_rate))
+        self.redraw_rate_edit.setValidator(QIntValidator(1, 100))
+        self.redraw_rate_edit.returnPressed.connect(self.update_redraw_rate)
+        redraw_rate_layout.addWidget(self.redraw_rate_edit)
+        control_layout.addLayout(redraw_rate_layout)
+
         # CSV file settings
         csv_group = QGroupBox("CSV Settings")
         csv_layout = QVBoxLayout()
@@ -156,10 +456,24 @@ class SerialPlotter(QMainWindow):
         self.legend.setParentItem(self.plot_widget.graphicsItem())
         self.legend.anchor(itemPos=(1, 0), parentPos=(1, 0), offset=(-10, 10))
 
-        # Timer
-        self.timer = QTimer()
-        self.timer.timeout.connect(self.update_plot)
-        self.timer.start(50)  # 50ms
+        # Timer: serial input arrives from SerialReader; redraws are coalesced into at
+        # most max_redraw_rate per second and the timer is idle until something changes
+        self.draw_timer = QTimer()
+        self.draw_timer.setSingleShot(True)
+        self.draw_timer.setInterval(1000 // self.max_redraw_rate)
+        self.draw_timer.timeout.connect(self._redraw)
+
+        # Legend and y-range work changes rarely and runs on its own, slower timer
+        self.ui_timer = QTimer()
+        self.ui_timer.setSingleShot(True)
+        self.ui_timer.setInterval(200)  # 5 Hz
+        self.ui_timer.timeout.connect(self._refresh_ui)
+
+        # Checkbox name edits are coalesced into one QSettings write
+        self._settings_timer = QTimer(self)
+        self._settings_timer.setSingleShot(True)
+        self._settings_timer.setInterval(500)
+        self._settings_timer.timeout.connect(self._flush_names)
 
     def update_ports(self):
         current_port = self.port_combo.currentText()
@@ -182,6 +496,7 @@ class SerialPlotter(QMainWindow):
         for attempt in range(retry_count):
             try:
                 self.serial = serial.Serial(port, baud, timeout=1)
+                _try_set_low_latency(self.serial)
                 self.connect_button.setText("Disconnect")
                 self.clear_plot()
                 self.error_label.setText("")
@@ -190,6 +505,7 @@ class SerialPlotter(QMainWindow):
                 self.run_stop_button.setText("Stop")
                 self.legend.clear()
                 self.open_csv_file()
+                self.start_reader()
                 return
             except serial.SerialException as e:
                 if attempt < retry_count - 1:
@@ -201,7 +517,29 @@ class SerialPlotter(QMainWindow):
                 self.error_label.setText(f"Unexpected error: {str(e)}")
                 break
 
+    def start_reader(self):
+        if _parse_chunk is not None:
+            # Compile (or load from cache) before reading so the driver buffer is drained from the start
+            _parse_chunk(np.frombuffer(b'0', dtype=np.uint8))
+        self.reader = SerialReader(self.serial, self)
+        self.reader.rowsReady.connect(self._drain_reader, Qt.QueuedConnection)
+        self.reader.errorOccurred.connect(self.error_label.setText, Qt.QueuedConnection)
+        self._update_csv_sink()
+        self.reader.start()
+
+    def _update_csv_sink(self):
+        # The reader queues rows for the CSV writer itself, so the log never loses rows
+        # the display had to drop
+        if self.reader:
+            self.reader.csv_sink = self._csv_q if self.is_running and not self._csv_failed else None
+
+    def stop_reader(self):
+        if self.reader:
+            self.reader.stop()
+            self.reader = None
+
     def disconnect_serial(self):
+        self.stop_reader()
         if self.serial:
             try:
                 self.serial.close()
@@ -216,92 +554,272 @@ class SerialPlotter(QMainWindow):
                 self.close_csv_file()
 
     def clear_plot(self):
-        self.data = []
+        self._reset_ring()
         for line in self.lines:
             self.plot_widget.removeItem(line)
         self.lines = []
         self.legend.clear()
+        self._legend_dirty = True
         self.total_data_count = 0
+        self._clear_skip_message()
 
         # Clear checkboxes but keep their names
+        if self._settings_timer.isActive():
+            self._flush_names()
         for container, checkbox, line_edit, delete_button in self.checkbox_widgets:
             self.checkbox_layout.removeWidget(container)
             container.deleteLater()
         self.checkboxes.clear()
         self.checkbox_widgets.clear()
+        self._editing = None  # An open name edit belonged to a deleted checkbox
+        self._text_widths.clear()
 
         # Recreate checkboxes with saved names
         checkbox_names = self.settings.value("checkbox_names", [])
         for name in checkbox_names:
-            color = pg.intColor(len(self.checkboxes), hues=len(checkbox_names), values=1, maxValue=255)
+            color = self._palette[len(self.checkboxes) % PALETTE_SIZE].color()
             self.add_checkbox(name, color)
 
     def toggle_run_stop(self):
         if self.serial and self.serial.is_open:
             self.is_running = not self.is_running
             self.run_stop_button.setText("Stop" if self.is_running else "Run")
+            self._update_csv_sink()
+
+    def update_redraw_rate(self):
+        try:
+            self.max_redraw_rate = int(self.redraw_rate_edit.text())
+        except ValueError:
+            return
+        self.draw_timer.setInterval(1000 // self.max_redraw_rate)
 
     def update_max_points(self):
         try:
-            self.max_points = int(self.max_points_edit.text())
+            max_points = int(self.max_points_edit.text())
         except ValueError:
-            pass
+            return
+        self._resize_ring(max_points, self._ring.shape[1])
+        self._mark_dirty()
+
+    def _reset_ring(self, n_channels=0):
+        # Samples are kept column-major so each channel is a contiguous slice.
+        # Every row is also mirrored max_points further on, so the newest
+        # max_points rows are always one contiguous view and never copied.
+        # Storage is sized for _capacity points so max_points can change in place.
+        self._capacity = max(self._capacity, self.max_points)
+        self._ring = np.full((2 * self._capacity, n_channels), np.nan, dtype=np.float32, order='F')
+        # Sample indices in the ring are consecutive, so x is a shared base plus an offset
+        self._x_base = np.arange(self._capacity, dtype=np.int64)
+        self._head = 0
+        self._count = 0
+        # Per-channel bounds of the samples currently in the ring (NaN when empty)
+        self._col_min = np.full(n_channels, np.nan, dtype=np.float32)
+        self._col_max = np.full(n_channels, np.nan, dtype=np.float32)
+        self._y_range = None
+        self._x_range = None
+        # Curves skip pyqtgraph's finite check while their last NaN/inf is out of the window
+        self._last_nonfinite = np.full(n_channels, -1, dtype=np.int64)
+
+    def _resize_ring(self, max_points, n_channels):
+        _, y_data = self._ring_window()
+        keep = min(self._count, max_points)
+        # Copy first: the kept rows may overlap their new position
+        tail = y_data[len(y_data) - keep:].copy()
+
+        # Only reallocate when the ring has to grow
+        if max_points > self._capacity or n_channels > self._ring.shape[1]:
+            self._capacity = max(self._capacity, max_points)
+            self._ring = np.full((2 * self._capacity, n_channels), np.nan, dtype=np.float32, order='F')
+            self._x_base = np.arange(self._capacity, dtype=np.int64)
+        ring = self._ring
+        for offset in (0, max_points):
+            ring[offset:offset + keep, :tail.shape[1]] = tail
+
+        self.max_points = max_points
+        self._head = keep % max_points
+        self._count = keep
+        finite = _finite_only(ring[:keep])
+        self._col_min = np.fmin.reduce(finite, axis=0, initial=np.nan)
+        self._col_max = np.fmax.reduce(finite, axis=0, initial=np.nan)
+        self._x_range = None
+        self._last_nonfinite = _last_nonfinite_index(ring[:keep], self.total_data_count - keep)
+
+    def _ring_append(self, rows):
+        if isinstance(rows, np.ndarray):
+            n_channels = rows.shape[1]
+        else:
+            n_channels = max(len(values) for values in rows)
+        if n_channels > self._ring.shape[1]:
+            self._resize_ring(self.max_points, n_channels)
+
+        block = np.full((len(rows), self._ring.shape[1]), np.nan, dtype=np.float32)
+        if isinstance(rows, np.ndarray):
+            block[:, :n_channels] = rows
+        else:
+            for r, values in enumerate(rows):
+                block[r, :len(values)] = values  # Short rows stay NaN-padded
+        self.total_data_count += len(rows)
+
+        # Only the newest max_points rows survive a single write
+        block = block[-self.max_points:]
+        n = len(block)
+        idx = (self._head + np.arange(n)) % self.max_points
+
+        # Columns whose current bound is about to be overwritten need a rescan
+        n_evicted = max(0, self._count + n - self.max_points)
+        evicted = self._ring[idx[n - n_evicted:]]
+        stale = ((evicted <= self._col_min) | (evicted >= self._col_max)).any(axis=0)
+
+        for offset in (0, self.max_points):
+            self._ring[idx + offset] = block
+        self._head = (self._head + n) % self.max_points
+        self._count = min(self._count + n, self.max_points)
+
+        self._last_nonfinite = np.maximum(self._last_nonfinite, _last_nonfinite_index(block, self.total_data_count - n))
+        finite = _finite_only(block)
+        self._col_min = np.fmin(self._col_min, np.fmin.reduce(finite, axis=0))
+        self._col_max = np.fmax(self._col_max, np.fmax.reduce(finite, axis=0))
+        if stale.any():
+            window = _finite_only(self._ring[:self._count, stale])
+            self._col_min[stale] = np.fmin.reduce(window, axis=0)
+            self._col_max[stale] = np.fmax.reduce(window, axis=0)
+
+    def _ring_window(self):
+        """Return the x samples and a view of the y samples in the ring, oldest first."""
+        end = self._head + self.max_points
+        start = end - self._count
+        x_data = self._x_base[:self._count] + (self.total_data_count - self._count)
+        return x_data, self._ring[start:end]
+
+    def _drain_reader(self):
+        if self.reader:
+            batches, dropped = self.reader.drain()
+            if dropped:
+                self._skip_rows(dropped)
+            elif batches:
+                self._clear_skip_message()
+            for rows in batches:
+                self._ingest_rows(rows)
+
+    def _skip_rows(self, n):
+        """Advance past rows the reader dropped, leaving a NaN gap in the plot."""
+        if self.serial and self.serial.is_open and self.is_running:
+            logged = self._csv_q is not None and not self._csv_failed
+            self._skip_message = (f"Display fell behind: {n} rows not plotted"
+                                  f"{' (still logged to CSV)' if logged else ''}")
+            self.error_label.setText(self._skip_message)
+            gap = min(n, self.max_points)
+            self.total_data_count += n - gap
+            self._ring_append(np.full((gap, self._ring.shape[1]), np.nan))
+            self._mark_dirty()
+
+    def _clear_skip_message(self):
+        # Leave the label alone if another error has replaced the notice since
+        if self._skip_message is not None:
+            if self.error_label.text() == self._skip_message:
+                self.error_label.setText("")
+            self._skip_message = None
 
-    def update_plot(self):
+    def _ingest_rows(self, rows):
         if self.serial and self.serial.is_open and self.is_running:
             try:
-                new_data = False
-                values = []
-                while self.serial.in_waiting:
-                    line = self.serial.readline().decode().strip()
-                    try:
-                        values = [float(x) for x in line.split(',')]
-                        self.data.append(values)
-                        self.total_data_count += 1
-                        new_data = True
-                        if self.csv_writer:
-                            self.csv_writer.writerow(values)
-                    except ValueError:
-                        # Ignore non-numeric input
-                        pass
-
-                self.data = self.data[-self.max_points:]
-
-                if new_data and values:
-                    while len(self.lines) < len(values):
-                        color = pg.intColor(len(self.lines), hues=len(values), values=1, maxValue=255)
-                        new_line = self.plot_widget.plot(pen=pg.mkPen(color=color, width=3))
-                        self.lines.append(new_line)
-                        if len(self.checkboxes) < len(values):
-                            self.add_checkbox(f"Data {len(self.lines)}", color)
-
-                    self.update_plot_data()
+                self._ring_append(rows)
+
+                values = rows[-1]
+                while len(self.lines) < len(values):
+                    pen = self._palette[len(self.lines) % PALETTE_SIZE]
+                    # Thin pens and segmented lines keep Qt's painter on its fast path
+                    new_line = self.plot_widget.plot(pen=pen)
+                    new_line.curve.setSegmentedLineMode('on')
+                    # Only draw about one peak pair per pixel of the visible range
+                    new_line.setDownsampling(auto=True, method='peak')
+                    new_line.setClipToView(True)
+                    new_line.setVisible(self._is_line_visible(len(self.lines)))
+                    self.lines.append(new_line)
+                    self._legend_dirty = True
+                    if len(self.checkboxes) < len(values):
+                        self.add_checkbox(f"Data {len(self.lines)}", pen.color())
+
+                # With every channel unchecked there is nothing to redraw; the ring and
+                # CSV still take the rows so re-checking a channel shows current data
+                if self._any_visible:
+                    self._mark_dirty()
 
             except Exception as e:
                 self.error_label.setText(f"Error: {str(e)}")
 
+    def _mark_dirty(self):
+        self._dirty = True
+        if not self.draw_timer.isActive():
+            self.draw_timer.start()
+        if not self.ui_timer.isActive():
+            self.ui_timer.start()
+
+    def _redraw(self):
+        if self._dirty:
+            self._dirty = False
+            self.update_plot_data()
+
+    def _refresh_ui(self):
+        if self._legend_dirty:
+            self._legend_dirty = False
+            self.update_legend()
+        self.update_y_range()
+
     def update_plot_data(self):
+        x_data, y_data = self._ring_window()
+        finite = self._last_nonfinite < self.total_data_count - self._count
+
+        # Coalesce the ViewBox updates triggered by each setData into one repaint
+        view_box = self.plot_widget.getViewBox()
+        view_box.blockSignals(True)
+        try:
+            for i in np.flatnonzero(self._line_visible[:len(self.lines)]):
+                # Curves keep their arrays by reference and the ring is overwritten in place,
+                # so each gets its own copy of the contiguous float32 column
+                self.lines[i].setData(x=x_data, y=y_data[:, i].copy(),
+                                      skipFiniteCheck=bool(finite[i]),
+                                      connect='all' if finite[i] else 'finite')
+        finally:
+            view_box.blockSignals(False)
+            view_box.update()
+
+        # The x range stays on the data path so the newest samples are never clipped
+        self.update_x_range()
+
+    def update_x_range(self):
+        # Scroll in steps of about 1% of the window rather than on every new sample
+        if self._x_range is not None and self.total_data_count - 1 <= self._x_range[1]:
+            return
+        stride = max(1, self.max_points // 100)
+        hi = self.total_data_count + stride
+        lo = max(0, hi - self.max_points)
+        self._x_range = (lo, hi)
+        self.plot_widget.setXRange(lo, hi, padding=0)
+
+    def update_y_range(self):
+        # Bounds are maintained on insert, so no curve has to be rescanned here
+        n = min(len(self._line_visible), len(self._col_min))
+        visible = self._line_visible[:n]
+        lo = float(np.fmin.reduce(self._col_min[:n][visible], initial=np.nan))
+        hi = float(np.fmax.reduce(self._col_max[:n][visible], initial=np.nan))
+        if not (np.isfinite(lo) and np.isfinite(hi)) or (lo, hi) == self._y_range:
+            return
+        self._y_range = (lo, hi)
+        self.plot_widget.setYRange(lo, hi, padding=0.05)
+
+    def update_legend(self):
         self.legend.clear()
         has_visible_data = False
         visible_items = 0
         max_text_width = 0
-        font_metrics = QFontMetrics(self.font())
 
-        for i, line in enumerate(self.lines):
-            if i < len(self.checkboxes):
-                if self.checkboxes[i].isChecked():
-                    y_data = [d[i] for d in self.data if i < len(d)]
-                    start_x = max(0, self.total_data_count - len(y_data))
-                    x_data = list(range(start_x, self.total_data_count))
-                    line.setData(x=x_data, y=y_data)
-                    self.legend.addItem(line, self.checkboxes[i].text())
-                    has_visible_data = True
-                    visible_items += 1
-
-                    text_width = font_metrics.width(self.checkboxes[i].text())
-                    max_text_width = max(max_text_width, text_width)
-                else:
-                    line.clear()
+        for i in np.flatnonzero(self._line_visible[:len(self.lines)]):
+            self.legend.addItem(self.lines[i], self.checkboxes[i].text())
+            has_visible_data = True
+            visible_items += 1
+
+            max_text_width = max(max_text_width, self._text_width(self.checkboxes[i]))
 
         # Dynamically adjust legend size
         if has_visible_data:
@@ -313,13 +831,24 @@ class SerialPlotter(QMainWindow):
             self.legend.setVisible(False)
             self.legend.setGeometry(0, 0, 0, 0)
 
-        self.plot_widget.enableAutoRange(axis='y')
-        self.plot_widget.setXRange(max(0, self.total_data_count - self.max_points), self.total_data_count)
+    def _text_width(self, checkbox):
+        width = self._text_widths.get(checkbox)
+        if width is None:
+            width = self._text_widths[checkbox] = self._fm.horizontalAdvance(checkbox.text())
+        return width
+
+    def changeEvent(self, event):
+        if event.type() == QEvent.FontChange:
+            self._fm = QFontMetrics(self.font())
+            self._text_widths.clear()
+            self._legend_dirty = True
+            self._mark_dirty()
+        super().changeEvent(event)
 
     def add_checkbox(self, name, color):
         checkbox = QCheckBox(name)
         checkbox.setChecked(True)
-        checkbox.stateChanged.connect(self.update_plot_data)
+        checkbox.stateChanged.connect(self.update_visibility)
         
         line_edit = QLineEdit(name)
         line_edit.setVisible(False)
@@ -355,17 +884,33 @@ class SerialPlotter(QMainWindow):
         self.checkbox_layout.addWidget(container)
         self.checkboxes.append(checkbox)
         self.checkbox_widgets.append((container, checkbox, line_edit, delete_button))
+        self.update_visibility()
+
+    def update_visibility(self):
+        # Only called when checkboxes change, so the redraw path never queries Qt widgets
+        self._line_visible = np.array([cb.isChecked() for cb in self.checkboxes], dtype=bool)
+        self._any_visible = bool(self._line_visible.any())
+        for i, line in enumerate(self.lines):
+            line.setVisible(self._is_line_visible(i))
+        self._legend_dirty = True
+        self._mark_dirty()
+
+    def _is_line_visible(self, index):
+        return index < len(self._line_visible) and bool(self._line_visible[index])
 
     def delete_checkbox(self, checkbox, line_edit, delete_button):
         for container, cb, le, db in self.checkbox_widgets:
             if cb == checkbox:
+                if self._editing and self._editing[0] is checkbox:
+                    self._editing = None
                 self.checkbox_layout.removeWidget(container)
                 container.deleteLater()
                 self.checkboxes.remove(checkbox)
+                self._text_widths.pop(checkbox, None)
                 self.checkbox_widgets.remove((container, cb, le, db))
                 break
-        self.update_plot_data()
-        self.save_checkbox_names()  # Save names after deletion
+        self.update_visibility()
+        self.save_checkbox_names()
 
     def edit_checkbox_name(self, checkbox, line_edit, event):
         event.accept()  # Prevent event propagation to checkbox click handler
@@ -373,24 +918,30 @@ class SerialPlotter(QMainWindow):
         line_edit.setVisible(True)
         line_edit.setFocus()
         line_edit.selectAll()
+        self._editing = (checkbox, line_edit)
 
     def rename_checkbox(self, checkbox, line_edit):
         new_name = line_edit.text()
         checkbox.setText(new_name)
+        self._text_widths[checkbox] = self._fm.horizontalAdvance(new_name)
         checkbox.setVisible(True)
         line_edit.setVisible(False)
-        self.update_plot_data()
-        self.save_checkbox_names()  # Save names immediately after renaming
+        self._editing = None
+        self._legend_dirty = True
+        self._mark_dirty()
+        self.save_checkbox_names()
 
     def eventFilter(self, obj, event):
-        if event.type() == QEvent.MouseButtonPress:
-            for _, checkbox, line_edit, _ in self.checkbox_widgets:
-                if line_edit.isVisible():
-                    self.rename_checkbox(checkbox, line_edit)
-                    return True
+        if self._editing and event.type() == QEvent.MouseButtonPress:
+            self.rename_checkbox(*self._editing)
+            return True
         return super().eventFilter(obj, event)
 
     def save_checkbox_names(self):
+        self._settings_timer.start()  # Restarting pushes the write back
+
+    def _flush_names(self):
+        self._settings_timer.stop()
         checkbox_names = [cb.text() for cb in self.checkboxes]
         self.settings.setValue("checkbox_names", checkbox_names)
 
@@ -411,19 +962,23 @@ class SerialPlotter(QMainWindow):
         checkbox_states = self.settings.value("checkbox_states", [])
         
         for name, state in zip(checkbox_names, checkbox_states):
-            color = pg.intColor(len(self.checkboxes), hues=len(checkbox_names), values=1, maxValue=255)
+            color = self._palette[len(self.checkboxes) % PALETTE_SIZE].color()
             self.add_checkbox(name, color)
             self.checkboxes[-1].setChecked(state == "true")
 
         # If no saved names, add default checkboxes
         if not checkbox_names:
             for i in range(1, 6):  # Add 5 default checkboxes
-                color = pg.intColor(i-1, hues=5, values=1, maxValue=255)
+                color = self._palette[(i-1) % PALETTE_SIZE].color()
                 self.add_checkbox(f"Data {i}", color)
 
         self.max_points = int(self.settings.value("max_points", 200))
         self.max_points_edit.setText(str(self.max_points))
 
+        self.max_redraw_rate = int(self.settings.value("max_redraw_rate", 10))
+        self.redraw_rate_edit.setText(str(self.max_redraw_rate))
+        self.draw_timer.setInterval(1000 // self.max_redraw_rate)
+
         self.csv_filename_edit.setText(self.settings.value("csv_filename", "test"))
         folder = self.settings.value("csv_folder", "Not selected")
         self.csv_folder_label.setText(f"Selected Folder: {folder}")
@@ -432,18 +987,18 @@ class SerialPlotter(QMainWindow):
         self.settings.setValue("port", self.port_combo.currentText())
         self.settings.setValue("baud", self.baud_combo.currentText())
         
-        checkbox_names = [cb.text() for cb in self.checkboxes]
         checkbox_states = ["true" if cb.isChecked() else "false" for cb in self.checkboxes]
         
-        self.settings.setValue("checkbox_names", checkbox_names)
         self.settings.setValue("checkbox_states", checkbox_states)
         self.settings.setValue("max_points", self.max_points)
+        self.settings.setValue("max_redraw_rate", self.max_redraw_rate)
         self.settings.setValue("csv_filename", self.csv_filename_edit.text())
         self.settings.setValue("csv_folder", self.csv_folder_label.text().replace("Selected Folder: ", ""))
 
-        self.save_checkbox_names()  # Ensure checkbox names are saved
+        self._flush_names()  # Writes any pending name edits synchronously
 
     def restore_default(self):
+        self._settings_timer.stop()
         self.settings.clear()
         self.load_settings()
         self.clear_plot()
@@ -451,6 +1006,8 @@ class SerialPlotter(QMainWindow):
             self.checkbox_layout.removeWidget(cb)
             cb.deleteLater()
         self.checkboxes.clear()
+        self._text_widths.clear()
+        self.update_visibility()
         self.error_label.setText("Default settings restored")
 
     def select_csv_folder(self):
@@ -464,14 +1021,73 @@ class SerialPlotter(QMainWindow):
             folder = os.getcwd()
         filename = self.csv_filename_edit.text() + ".csv"
         filepath = os.path.join(folder, filename)
-        self.csv_file = open(filepath, 'a', newline='')
-        self.csv_writer = csv.writer(self.csv_file)
+        # Rows arrive in batches; a 1 MiB buffer keeps kernel writes infrequent.
+        # Nothing flushes or fsyncs until close, so a crash can lose up to 1 MiB of rows.
+        try:
+            raw = io.FileIO(filepath, 'a')
+        except OSError as e:
+            # Plotting still works without a log; the reader simply gets no CSV sink
+            self.error_label.setText(f"Error opening CSV: {str(e)}")
+            return
+        self.csv_file = io.TextIOWrapper(io.BufferedWriter(raw, buffer_size=1 << 20),
+                                         newline='', write_through=False)
+        # Disk writes happen on a daemon thread so a slow filesystem never stalls the GUI
+        self._csv_failed = False
+        self._csv_q = queue.SimpleQueue()
+        self._csv_thread = threading.Thread(target=self._csv_drain,
+                                            args=(self._csv_q, self.csv_file), daemon=True)
+        self._csv_thread.start()
+
+    def _csv_drain(self, q, csv_file):
+        failed = False
+        done = False
+        while not done:
+            batch = []
+            rows = q.get()
+            while True:
+                if rows is None:  # Sentinel from close_csv_file
+                    done = True
+                    break
+                # Rows are all floats, so the csv module's quoting logic is skipped; repr of a
+                # Python float gives the same digits csv.writer wrote, in its \r\n line format
+                if isinstance(rows, np.ndarray):
+                    rows = rows.tolist()
+                else:
+                    rows = (values.tolist() for values in rows)
+                batch.extend(','.join(map(repr, row)) for row in rows)
+                if len(batch) >= 512 or q.empty():
+                    break
+                rows = q.get()
+            # After a failed write the rest of the queue is discarded until the sentinel arrives
+            if batch and not failed:
+                batch.append('')
+                try:
+                    csv_file.write('\r\n'.join(batch))
+                except Exception as e:
+                    failed = True
+                    self.csvError.emit(f"Error writing CSV: {str(e)}")
+
+    def _on_csv_error(self, message):
+        self.error_label.setText(message)
+        self._csv_failed = True
+        self._update_csv_sink()  # Stop queueing rows nobody will write
 
     def close_csv_file(self):
+        if self.reader:
+            self.reader.csv_sink = None
         if self.csv_file:
-            self.csv_file.close()
-            self.csv_file = None
-            self.csv_writer = None
+            self._csv_q.put(None)
+            self._csv_thread.join()
+            self._csv_q = None
+            self._csv_thread = None
+            try:
+                # The only flush; buffered rows reach disk here. close() still releases
+                # the file when the flush fails
+                self.csv_file.close()
+            except Exception as e:
+                self.error_label.setText(f"Error writing CSV: {str(e)}")
+            finally:
+                self.csv_file = None
 
     def closeEvent(self, event):
         self.save_settings()
@@ -1,35 +1,45 @@
 import serial
 import numpy as np
+import io
 import time
 import msvcrt
 
-# 設定虛擬串行端口COM6和鮑率（例如9600）
-ser = serial.Serial('COM1', 9600)
+# 設定虛擬串行端口COM6和鮑率（9600 每秒只能傳約 960 位元組，不足以傳送 100 筆/秒）
+ser = serial.Serial('COM1', 115200)
 
 # 生成正弦波數據
 frequency1 = 1  # 第一個正弦波的頻率
 frequency2 = 5  # 第二個正弦波的頻率
 frequency3 = 10  # 第二個正弦波的頻率
 sampling_rate = 100  # 每秒的取樣數
+chunk_size = 10  # 每次傳輸的取樣數
 t = np.linspace(0, 1, sampling_rate)  # 時間軸
 
+# 正弦波每秒重複一次，預先計算並格式化成位元組
+sine_wave1 = np.sin(2 * np.pi * frequency1 * t)
+sine_wave2 = np.sin(2 * np.pi * frequency2 * t)
+sine_wave3 = np.sin(2 * np.pi * frequency3 * t)
+samples = np.column_stack([sine_wave1, sine_wave2, sine_wave3])
+chunks = []
+for i in range(0, sampling_rate, chunk_size):
+    buf = io.BytesIO()
+    np.savetxt(buf, samples[i:i + chunk_size], fmt='%.6f', delimiter=',')
+    chunks.append(buf.getvalue())
+
 try:
     print("傳輸開始，按下任意鍵停止...")
+    next_time = time.perf_counter()
     while True:
         # 檢查是否有按鍵被按下
         if msvcrt.kbhit():
             break
 
-        # 計算當前時刻的正弦波值
-        sine_wave1 = np.sin(2 * np.pi * frequency1 * t)
-        sine_wave2 = np.sin(2 * np.pi * frequency2 * t)
-        sine_wave3 = np.sin(2 * np.pi * frequency3 * t)
-
-        # 傳輸數據
-        for i in range(sampling_rate):
-            data = f"{sine_wave1[i]},{sine_wave2[i]},{sine_wave3[i]}\n"
-            ser.write(data.encode())
-            time.sleep(0.1)  # 控制傳輸速度，每次發送間隔10ms
+        # 傳輸數據，每次寫入一個區塊
+        for chunk in chunks:
+            ser.write(chunk)
+            # 控制傳輸速度，每個區塊間隔100ms；以時間點計算，扣除寫入所花的時間
+            next_time += chunk_size / sampling_rate
+            time.sleep(max(0.0, next_time - time.perf_counter()))
 
 except KeyboardInterrupt:
     print("傳輸中斷")
@@ -37,4 +47,4 @@ except KeyboardInterrupt:
 finally:
     # 關閉串行端口
     ser.close()
-    print("程式已關閉")
\ No newline at end of file
+    print("程式已關閉")